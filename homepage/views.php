@@ -16,20 +16,9 @@ set_timezone();
 $restore = "cat $home/BirdSongs/restore.log";
 
 if(is_authenticated() && (!isset($_SESSION['behind']) || !isset($_SESSION['behind_time']) || time() > $_SESSION['behind_time'] + 86400)) {
-  shell_exec("sudo -u".$user." git -C ".$home."/BirdNET-Pi fetch > /dev/null 2>/dev/null &");
-  $str = trim(shell_exec("sudo -u".$user." git -C ".$home."/BirdNET-Pi status"));
-  if (preg_match("/behind '.*?' by (\d+) commit(s?)\b/", $str, $matches)) {
-    $num_commits_behind = $matches[1];
-  }
-  if (preg_match('/\b(\d+)\b and \b(\d+)\b different commits each/', $str, $matches)) {
-    $num1 = (int) $matches[1];
-    $num2 = (int) $matches[2];
-    $num_commits_behind = $num1 + $num2;
-  }
-  if (stripos($str, "Your branch is up to date") !== false) {
-    $num_commits_behind = '0';
-  }
-  $_SESSION['behind'] = $num_commits_behind;
+  shell_exec("sudo -u".$user." nice -n 10 git -C ".$home."/BirdNET-Pi fetch > /dev/null 2>/dev/null &");
+  $git_status = get_commits_behind();
+  $_SESSION['behind'] = $git_status['behind'];
   $_SESSION['behind_time'] = time();
 }
 if(isset($_SESSION['behind'])&&intval($_SESSION['behind']) >= 99) {?>
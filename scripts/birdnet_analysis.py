@@ -1,7 +1,6 @@
 import logging
 import os
 import os.path
-import re
 import signal
 import sys
 import threading
@@ -46,6 +45,8 @@ def main():
         if shutdown:
             break
     log.info('backlog done')
+    # from here on it is only checked for membership on every new recording
+    backlog = frozenset(backlog)
 
     empty_count = 0
     for event in i.event_gen():
@@ -60,7 +61,7 @@ def main():
             continue
 
         (_, type_names, path, file_name) = event
-        if re.search('.wav$', file_name) is None:
+        if not file_name.endswith('.wav'):
             continue
         log.debug("PATH=[%s] FILENAME=[%s] EVENT_TYPES=%s", path, file_name, type_names)
 
@@ -68,7 +69,7 @@ def main():
         if file_path in backlog:
             # if we're very lucky, the first event could be for the file in the backlog that finished
             # while running get_wav_files()
-            backlog = []
+            backlog = frozenset()
             continue
 
         process_file(file_path, report_queue)
@@ -96,7 +97,7 @@ def process_file(file_name, report_queue):
         report_queue.join()
         report_queue.put((file, detections))
     except BaseException as e:
-        stderr = e.stderr.decode('utf-8') if isinstance(e, CalledProcessError) else ""
+        stderr = e.stderr.decode('utf-8', errors='replace') if isinstance(e, CalledProcessError) else ""
         log.exception(f'Unexpected error: {stderr}', exc_info=e)
 
 
@@ -120,7 +121,7 @@ def handle_reporting_queue(queue):
             heartbeat()
             os.remove(file.file_name)
         except BaseException as e:
-            stderr = e.stderr.decode('utf-8') if isinstance(e, CalledProcessError) else ""
+            stderr = e.stderr.decode('utf-8', errors='replace') if isinstance(e, CalledProcessError) else ""
             log.exception(f'Unexpected error: {stderr}', exc_info=e)
 
         queue.task_done()
@@ -66,11 +66,32 @@ function get_service_mount_name() {
   return $service_mount;
 }
 
+function get_commits_behind() {
+  $user = get_user();
+  $home = get_home();
+  // the porcelain header has both the running commit and the ahead/behind counts, skipping the untracked scan of the install directory
+  $str = trim(shell_exec("sudo -u".$user." nice -n 10 git -C ".$home."/BirdNET-Pi status --porcelain=v2 --branch --untracked-files=no"));
+  $ret = ['behind' => null, 'oid' => ""];
+  if (preg_match("/^# branch\.oid (\S+)$/m", $str, $matches)) {
+    $ret['oid'] = $matches[1];
+  }
+  if (preg_match("/^# branch\.ab \+(\d+) -(\d+)$/m", $str, $matches)) {
+    $ahead = (int) $matches[1];
+    $behind = (int) $matches[2];
+    if ($behind > 0) {
+      $ret['behind'] = $ahead + $behind;
+    } elseif ($ahead == 0) {
+      $ret['behind'] = '0';
+    }
+  }
+  return $ret;
+}
+
 function is_authenticated() {
   $ret = false;
   if (isset($_SERVER['PHP_AUTH_USER'])) {
     $config = get_config();
-    $ret = ($_SERVER['PHP_AUTH_PW'] == $config['CADDY_PWD'] && $_SERVER['PHP_AUTH_USER'] == 'birdnet');
+    $ret = (hash_equals(strval($config['CADDY_PWD']), $_SERVER['PHP_AUTH_PW']) && hash_equals('birdnet', $_SERVER['PHP_AUTH_USER']));
   }
   return $ret;
 }
@@ -130,7 +151,7 @@ function get_db() {
 
 function fetch_species_array($sort_by, $date=null) {
   $db = get_db();
-  $where = (isset($date)) ? "WHERE Date == \"$date\"" : "";
+  $where = (isset($date)) ? "WHERE Date == :date" : "";
   if ($sort_by === "occurrences") {
     $statement = $db->prepare("SELECT Date, Time, File_Name, Com_Name, Sci_Name, COUNT(*) as Count, MAX(Confidence) as MaxConfidence FROM detections $where GROUP BY Sci_Name ORDER BY COUNT(*) DESC");
   } elseif ($sort_by === "confidence") {
@@ -141,69 +162,54 @@ function fetch_species_array($sort_by, $date=null) {
     $statement = $db->prepare("SELECT Date, Time, File_Name, Com_Name, Sci_Name, COUNT(*) as Count, MAX(Confidence) as MaxConfidence FROM detections $where GROUP BY Sci_Name ORDER BY Com_Name ASC");
   }
   ensure_db_ok($statement);
+  if (isset($date)) {
+    $statement->bindValue(':date', $date, SQLITE3_TEXT);
+  }
   $result = $statement->execute();
   return $result;
 }
 
 function fetch_best_detection($com_name) {
   $db = get_db();
-  $statement = $db->prepare("SELECT Com_Name, Sci_Name, COUNT(*), MAX(Confidence), File_Name, Date, Time from detections WHERE Com_Name = \"$com_name\"");
+  $statement = $db->prepare("SELECT Com_Name, Sci_Name, COUNT(*), MAX(Confidence), File_Name, Date, Time from detections WHERE Com_Name = :com_name");
   ensure_db_ok($statement);
+  $statement->bindValue(':com_name', $com_name, SQLITE3_TEXT);
   $result = $statement->execute();
   return $result;
 }
 
 function fetch_all_detections($sci_name, $sort_by, $date=null) {
   $db = get_db();
-  $filter = (isset($date)) ? "AND Date == \"$date\"" : "";
+  $filter = (isset($date)) ? "AND Date == :date" : "";
   if ($sort_by === "occurrences") {
-    $statement = $db->prepare("SELECT * FROM detections WHERE Sci_Name == \"$sci_name\" $filter ORDER BY COUNT(*) DESC");
+    $statement = $db->prepare("SELECT * FROM detections WHERE Sci_Name == :sci_name $filter ORDER BY COUNT(*) DESC");
   } elseif ($sort_by === "confidence") {
-    $statement = $db->prepare("SELECT * FROM detections WHERE Sci_Name == \"$sci_name\" $filter ORDER BY Confidence DESC");
+    $statement = $db->prepare("SELECT * FROM detections WHERE Sci_Name == :sci_name $filter ORDER BY Confidence DESC");
   } else {
     $order = (isset($date)) ? "Time DESC" : "Date DESC, Time DESC";
-    $statement = $db->prepare("SELECT * FROM detections where Sci_Name == \"$sci_name\" $filter ORDER BY $order");
+    $statement = $db->prepare("SELECT * FROM detections where Sci_Name == :sci_name $filter ORDER BY $order");
   }
   ensure_db_ok($statement);
+  $statement->bindValue(':sci_name', $sci_name, SQLITE3_TEXT);
+  if (isset($date)) {
+    $statement->bindValue(':date', $date, SQLITE3_TEXT);
+  }
   $result = $statement->execute();
   return $result;
 }
 
 function get_summary() {
   $db = get_db();
-  $statement = $db->prepare('SELECT COUNT(*) FROM detections');
+  // one pass over the table instead of five statements, this is polled by every todays_detections refresh
+  $statement = $db->prepare('SELECT COUNT(*) AS totalcount,
+    COUNT(CASE WHEN Date == DATE(\'now\', \'localtime\') THEN 1 END) AS todaycount,
+    COUNT(CASE WHEN Date == DATE(\'now\', \'localtime\') AND Time >= TIME(\'now\', \'localtime\', \'-1 hour\') THEN 1 END) AS hourcount,
+    COUNT(DISTINCT CASE WHEN Date == DATE(\'now\', \'localtime\') THEN Sci_Name END) AS speciestally,
+    COUNT(DISTINCT Sci_Name) AS totalspeciestally
+    FROM detections');
   ensure_db_ok($statement);
   $result = $statement->execute();
-  $totalcount = $result->fetchArray(SQLITE3_ASSOC);
-
-  $statement2 = $db->prepare('SELECT COUNT(*) FROM detections WHERE Date == DATE(\'now\', \'localtime\')');
-  ensure_db_ok($statement2);
-  $result2 = $statement2->execute();
-  $todaycount = $result2->fetchArray(SQLITE3_ASSOC);
-
-  $statement3 = $db->prepare('SELECT COUNT(*) FROM detections WHERE Date == Date(\'now\', \'localtime\') AND TIME >= TIME(\'now\', \'localtime\', \'-1 hour\')');
-  ensure_db_ok($statement3);
-  $result3 = $statement3->execute();
-  $hourcount = $result3->fetchArray(SQLITE3_ASSOC);
-
-  $statement5 = $db->prepare('SELECT COUNT(DISTINCT(Sci_Name)) FROM detections WHERE Date == Date(\'now\',\'localtime\')');
-  ensure_db_ok($statement5);
-  $result5 = $statement5->execute();
-  $todayspeciestally = $result5->fetchArray(SQLITE3_ASSOC);
-
-  $statement6 = $db->prepare('SELECT COUNT(DISTINCT(Sci_Name)) FROM detections');
-  ensure_db_ok($statement6);
-  $result6 = $statement6->execute();
-  $totalspeciestally = $result6->fetchArray(SQLITE3_ASSOC);
-
-  $ret = [
-    'totalcount' => $totalcount['COUNT(*)'],
-    'todaycount' => $todaycount['COUNT(*)'],
-    'hourcount' => $hourcount['COUNT(*)'],
-    'speciestally' => $todayspeciestally['COUNT(DISTINCT(Sci_Name))'],
-    'totalspeciestally' => $totalspeciestally['COUNT(DISTINCT(Sci_Name))']
-  ];
-  return $ret;
+  return $result->fetchArray(SQLITE3_ASSOC);
 }
 
 class ImageProvider {
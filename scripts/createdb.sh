@@ -16,8 +16,8 @@ CREATE TABLE IF NOT EXISTS detections (
   Overlap FLOAT,
   File_Name VARCHAR(100) NOT NULL);
 CREATE INDEX "detections_Com_Name" ON "detections" ("Com_Name");
-CREATE INDEX "detections_Sci_Name" ON "detections" ("Sci_Name");
 CREATE INDEX "detections_Date_Time" ON "detections" ("Date" DESC, "Time" DESC);
+CREATE INDEX "detections_Sci_Name_Date_Time" ON "detections" ("Sci_Name", "Date" DESC, "Time" DESC);
 EOF
 chown $USER:$USER $HOME/BirdNET-Pi/scripts/birds.db
 chmod g+w $HOME/BirdNET-Pi/scripts/birds.db
@@ -15,25 +15,40 @@ from matplotlib.colors import LogNorm
 
 from utils.helpers import DB_PATH, FONT_DIR, get_settings, get_font
 
+_CONN = None
+
+
+def get_connection():
+    # in daemon mode we run every few minutes, keep the read-only handle around
+    global _CONN
+    if _CONN is None:
+        uri = f"file:{DB_PATH}?mode=ro"
+        _CONN = sqlite3.connect(uri, uri=True)
+    return _CONN
+
 
 def get_data(now=None):
-    uri = f"file:{DB_PATH}?mode=ro"
-    conn = sqlite3.connect(uri, uri=True)
+    conn = get_connection()
     if now is None:
         now = datetime.now()
-    df = pd.read_sql_query(f"SELECT * from detections WHERE Date = DATE('{now.strftime('%Y-%m-%d')}')",
-                           conn)
+    # all the rollups of the plot are derived from this one read, only fetch the columns they use
+    df = pd.read_sql_query("SELECT Date, Time, Sci_Name, Com_Name, Confidence from detections WHERE Date = DATE(?)",
+                           conn, params=(now.strftime('%Y-%m-%d'),))
 
     # Convert Date and Time Fields to Panda's format
     df['Date'] = pd.to_datetime(df['Date'])
     df['Time'] = pd.to_datetime(df['Time'], unit='ns')
 
     # Add round hours to dataframe
-    df['Hour of Day'] = [r.hour for r in df.Time]
+    df['Hour of Day'] = df['Time'].dt.hour
 
     return df, now
 
 
+def chart_path(name, now):
+    return os.path.expanduser(f"~/BirdSongs/Extracted/Charts/{name}-{now.strftime('%Y-%m-%d')}.png")
+
+
 # Function to show value on bars - from https://stackoverflow.com/questions/43214978/seaborn-barplot-displaying-values
 def show_values_on_bars(ax, label):
     conf = get_settings()
@@ -178,8 +193,7 @@ def create_plot(df_plt_today, now, is_top=None):
     f.subplots_adjust(left=0.125, right=0.9, top=top, wspace=0)
 
     # Save combined plot
-    save_name = os.path.expanduser(f"~/BirdSongs/Extracted/Charts/{name}-{now.strftime('%Y-%m-%d')}.png")
-    plt.savefig(save_name)
+    plt.savefig(chart_path(name, now))
     plt.show()
     plt.close()
 
@@ -196,6 +210,7 @@ def load_fonts():
 def main(daemon, sleep_m):
     load_fonts()
     last_run = None
+    last_plot = None
     while True:
         now = datetime.now()
         # now = datetime.strptime('2023-12-13T23:59:59', "%Y-%m-%dT%H:%M:%S")
@@ -209,10 +224,15 @@ def main(daemon, sleep_m):
             data, time = get_data(yesterday)
         else:
             data, time = get_data(now)
-        if not data.empty:
-            create_plot(data, time)
-        else:
+        # rendering is the expensive part on a Pi: only redraw when the detections changed (new, deleted or
+        # re-identified ones), the hour changed, since the current hour is highlighted, or the chart is gone
+        plot_key = (time.strftime('%Y-%m-%d %H'),
+                    pd.util.hash_pandas_object(data[['Time', 'Sci_Name', 'Com_Name', 'Confidence']], index=False).sum())
+        if data.empty:
             print('empty dataset')
+        elif plot_key != last_plot or not os.path.exists(chart_path('Combo', time)):
+            create_plot(data, time)
+            last_plot = plot_key
         if daemon:
             last_run = now
             sleep(60 * sleep_m)
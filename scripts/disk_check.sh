@@ -2,7 +2,9 @@
 set -x
 
 source /etc/birdnet/birdnet.conf
-used="$(df -h ${EXTRACTED} | tail -n1 | awk '{print $5}')"
+# only ask df for the Use% column and take its last word in bash, no tail/awk pipeline
+used="$(df --output=pcent ${EXTRACTED})"
+used="${used##*[[:space:]]}"
 purge_threshold="${PURGE_THRESHOLD:-95}"
 
 if [ "${used//%}" -ge "$purge_threshold" ]; then
@@ -104,17 +104,25 @@ if(isset($_GET['shiftfile'])) {
 
     if(isset($_GET['doshift'])) {
   $freqshift_tool = $config['FREQSHIFT_TOOL'];
-
-  if ($freqshift_tool == "ffmpeg") {
-    $cmd = "sudo /usr/bin/nohup /usr/bin/ffmpeg -y -i ".escapeshellarg($pi.$filename)." -af \"rubberband=pitch=".$config['FREQSHIFT_LO']."/".$config['FREQSHIFT_HI']."\" ".escapeshellarg($shifted_path.$filename)."";
-    shell_exec("sudo mkdir -p ".$shifted_path.$dir." && ".$cmd);
-
-  } else if ($freqshift_tool == "sox") {
-    //linux.die.net/man/1/sox
-    $soxopt = "-q";
-    $soxpitch = $config['FREQSHIFT_PITCH'];
-    $cmd = "sudo /usr/bin/nohup /usr/bin/sox ".escapeshellarg($pi.$filename)." ".escapeshellarg($shifted_path.$filename)." pitch ".$soxopt." ".$soxpitch;
-   shell_exec("sudo mkdir -p ".$shifted_path.$dir." && ".$cmd);
+  // a shifted copy made after the source and the last settings change is still good, don't transcode it again.
+  // only complete files can be found there, the tools write to a temporary name that is moved into place
+  $shifted_mtime = @filemtime($shifted_path.$filename);
+  $reuse_shifted = $shifted_mtime !== false && $shifted_mtime >= max(filemtime($pi.$filename), filemtime('/etc/birdnet/birdnet.conf'));
+  $shifted_tmp = $shifted_path.$dir."/.".$fn.".".getmypid().".".$ext;
+  $finish = " && sudo mv -f ".escapeshellarg($shifted_tmp)." ".escapeshellarg($shifted_path.$filename)." || sudo rm -f ".escapeshellarg($shifted_tmp);
+
+  if (!$reuse_shifted) {
+    if ($freqshift_tool == "ffmpeg") {
+      $cmd = "sudo /usr/bin/nohup /usr/bin/ffmpeg -y -i ".escapeshellarg($pi.$filename)." -af \"rubberband=pitch=".$config['FREQSHIFT_LO']."/".$config['FREQSHIFT_HI']."\" ".escapeshellarg($shifted_tmp)."";
+      shell_exec("sudo mkdir -p ".$shifted_path.$dir." && ".$cmd.$finish);
+
+    } else if ($freqshift_tool == "sox") {
+      //linux.die.net/man/1/sox
+      $soxopt = "-q";
+      $soxpitch = $config['FREQSHIFT_PITCH'];
+      $cmd = "sudo /usr/bin/nohup /usr/bin/sox ".escapeshellarg($pi.$filename)." ".escapeshellarg($shifted_tmp)." pitch ".$soxopt." ".$soxpitch;
+      shell_exec("sudo mkdir -p ".$shifted_path.$dir." && ".$cmd.$finish);
+    }
   }
     } else {
      $cmd = "sudo rm -f " . escapeshellarg($shifted_path.$filename);
@@ -468,7 +468,7 @@ else:
     fig.add_trace(go.Bar(y=plt_topN_today.index.tolist(), x=plt_topN_today.values.tolist(), marker_color='seagreen', orientation='h'), row=1,
                   col=1)
 
-    df6['Hour of Day'] = [r.hour for r in df6.index.time]
+    df6['Hour of Day'] = df6.index.hour
     heat = pd.crosstab(df6['Com_Name'], df6['Hour of Day'])
     # Order heatmap Birds by frequency of occurrance
     heat.index = pd.CategoricalIndex(heat.index, categories=freq_order)
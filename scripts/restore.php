@@ -72,9 +72,8 @@ if (!empty($_FILES)) {
 	}
 }
 
-while ($buff = fread($in, 4096)) {
-	fwrite($out, $buff);
-}
+// copy in one call, PHP streams it through the pipe without a userland read/write per 4K
+stream_copy_to_stream($in, $out);
 
 @fclose($out);
 @fclose($in);
@@ -5,6 +5,24 @@ $home = get_home();
 function do_service_mount($action) {
   echo "value=\"sudo systemctl ".$action." ".get_service_mount_name()." && sudo reboot\"";
 }
+function service_states() {
+  static $states = null;
+  if ($states === null) {
+    $names = ["livestream.service", "web_terminal.service", "birdnet_log.service", "birdnet_analysis.service",
+              "birdnet_stats.service", "birdnet_recording.service", "chart_viewer.service", "spectrogram_viewer.service",
+              get_service_mount_name()];
+    // one systemctl show for every unit on the page, it prints one block per unit in argument order
+    // it only reads the unit state, status would also pull the journal through sudo and grep
+    $op = shell_exec("systemctl show --property=LoadState --property=ActiveState --property=SubState -- ".implode(" ", array_map("escapeshellarg", $names)));
+    $blocks = preg_split("/\n\s*\n/", trim((string)$op));
+    $states = [];
+    foreach ($names as $i => $name) {
+      preg_match_all("/^(\w+)=(.*)$/m", $blocks[$i] ?? "", $matches);
+      $states[$name] = array_combine($matches[1], $matches[2]);
+    }
+  }
+  return $states;
+}
 function service_status($name) {
   global $home;
   if($name == "birdnet_analysis.service") {
@@ -14,15 +32,17 @@ function service_status($name) {
        return;
     }
   } 
-  $op = shell_exec("sudo systemctl status ".$name." | grep Active");
-  if (stripos($op, " active (running)") || stripos($op, " active (mounted)")) {
+  $state = service_states()[$name] ?? [];
+  $active = $state['ActiveState'] ?? "";
+  $sub = $state['SubState'] ?? "";
+  if ($active == "active" && ($sub == "running" || $sub == "mounted")) {
       echo "<span style='color:green'>(active)</span>";
-  } elseif (stripos($op, " inactive ")) {
+  } elseif ($active == "inactive" && ($state['LoadState'] ?? "") != "not-found") {
       echo "<span style='color:#fc6603'>(inactive)</span>";
   } else {
       $status = "ERROR";
-      if (preg_match("/(\S*)\s*\((\S+)\)/", $op, $matches)) {
-          $status =  $matches[1]. " [" . $matches[2] . "]";
+      if ($active != "" && $active != "inactive") {
+          $status = $active . " [" . $sub . "]";
       }
       echo "<span style='color:red'>($status)</span>";
   }
@@ -121,8 +121,10 @@ if (isset($_GET['delete'])) {
   $species = htmlspecialchars_decode($_GET['delete'], ENT_QUOTES);
   $info = collect_species_targets($db, $species, $home, $base);
   $deleted = count($info['files']);
-  foreach ($info['dirs'] as $dir) {
-    if (exec("sudo rm -r $dir 2>&1", $output)) {
+  if (!empty($info['dirs'])) {
+    // one sudo rm for every directory of the species instead of a fork per date
+    $dirs = implode(' ', array_map('escapeshellarg', $info['dirs']));
+    if (exec("sudo rm -r $dirs 2>&1", $output)) {
       echo "Error - files deletion failed : " . implode(", ", $output) . "<br>";
 	  exit;
     }
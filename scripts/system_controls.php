@@ -7,20 +7,10 @@ require_once "scripts/common.php";
 $user = get_user();
 $home = get_home();
 
-$fetch = shell_exec("sudo -u".$user." git -C ".$home."/BirdNET-Pi fetch 2>&1");
-$str = trim(shell_exec("sudo -u".$user." git -C ".$home."/BirdNET-Pi status"));
-if (preg_match("/behind '.*?' by (\d+) commit(s?)\b/", $str, $matches)) {
-  $num_commits_behind = $matches[1];
-}
-if (preg_match('/\b(\d+)\b and \b(\d+)\b different commits each/', $str, $matches)) {
-    $num1 = (int) $matches[1];
-    $num2 = (int) $matches[2];
-    $num_commits_behind = $num1 + $num2;
-}
-if (stripos($str, "Your branch is up to date") !== false) {
-  $num_commits_behind = '0';
-}
-$_SESSION['behind'] = $num_commits_behind;
+$fetch = shell_exec("sudo -u".$user." nice -n 10 git -C ".$home."/BirdNET-Pi fetch 2>&1");
+$git_status = get_commits_behind();
+$curr_hash = $git_status['oid'];
+$_SESSION['behind'] = $git_status['behind'];
 $_SESSION['behind_time'] = time();
 
 $restore = "cat $home/BirdSongs/restore.log";
@@ -60,10 +50,6 @@ function update() {
   <button id="pickfile" type="button" href="javascript:;">Restore data</button>
 </div>
 <div><a href="scripts/backup.php" download ><button onclick="return confirm('Download backup? Note that this could take a long time.')">Backup data</button></a></div>
-<?php
-  $cmd="cd ".$home."/BirdNET-Pi && sudo -u ".$user." git rev-list --max-count=1 HEAD";
-  $curr_hash = shell_exec($cmd);
-?>
   <p style="font-size:11px;text-align:center"></br></br>Running version: </p>
   <a href="https://github.com/cpieper/BirdNET-Pibird/commit/<?php echo $curr_hash; ?>" target="_blank">
     <p style="font-size:11px;text-align:center;box-sizing: border-box"><?php echo $curr_hash; ?></p>
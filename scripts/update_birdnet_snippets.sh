@@ -266,7 +266,9 @@ if [ -L $HOME/BirdNET-Pi/model/labels.txt ]; then
 fi
 
 sqlite3 $HOME/BirdNET-Pi/scripts/birds.db << EOF
-CREATE INDEX IF NOT EXISTS "detections_Sci_Name" ON "detections" ("Sci_Name");
+DROP INDEX IF EXISTS "detections_Sci_Name";
+CREATE INDEX IF NOT EXISTS "detections_Date_Time" ON "detections" ("Date" DESC, "Time" DESC);
+CREATE INDEX IF NOT EXISTS "detections_Sci_Name_Date_Time" ON "detections" ("Sci_Name", "Date" DESC, "Time" DESC);
 EOF
 
 # update snippets above
@@ -6,21 +6,29 @@ import librosa
 import numpy as np
 
 from .classes import Detection, ParseFileName
-from .helpers import get_settings, get_language
+from .helpers import get_settings, get_language, read_cached
 from .models import get_model
 
 log = logging.getLogger(__name__)
 
 MODEL = None
 
+INCLUDE_LIST = os.path.expanduser("~/BirdNET-Pi/include_species_list.txt")
+EXCLUDE_LIST = os.path.expanduser("~/BirdNET-Pi/exclude_species_list.txt")
+WHITELIST_LIST = os.path.expanduser("~/BirdNET-Pi/whitelist_species_list.txt")
+
+
+def parse_species_list(text):
+    # only used for membership tests, one per confident detection
+    return frozenset(line.strip().split('_')[0] for line in text.splitlines() if line.strip())
+
 
 def loadCustomSpeciesList(path):
-    species_list = []
-    if os.path.isfile(path):
-        with open(path, 'r') as csfile:
-            species_list = [line.strip().split('_')[0] for line in csfile.readlines()]
+    if not os.path.isfile(path):
+        return frozenset()
 
-    return species_list
+    # the lists are read for every recording but only change when edited
+    return read_cached(path, parse_species_list)
 
 
 def splitSignal(sig, rate, overlap, seconds=3.0, minlen=1.5):
@@ -138,30 +146,34 @@ def load_global_model():
 
 
 def run_analysis(file):
-    include_list = loadCustomSpeciesList(os.path.expanduser("~/BirdNET-Pi/include_species_list.txt"))
-    exclude_list = loadCustomSpeciesList(os.path.expanduser("~/BirdNET-Pi/exclude_species_list.txt"))
-    whitelist_list = loadCustomSpeciesList(os.path.expanduser("~/BirdNET-Pi/whitelist_species_list.txt"))
+    include_list = loadCustomSpeciesList(INCLUDE_LIST)
+    exclude_list = loadCustomSpeciesList(EXCLUDE_LIST)
+    whitelist_list = loadCustomSpeciesList(WHITELIST_LIST)
 
     conf = get_settings()
     model = load_global_model()
     names = get_language(conf['DATABASE_LANG'])
+    # parse the settings once, not for every chunk and every species
+    overlap = conf.getfloat('OVERLAP')
+    min_confidence = conf.getfloat('CONFIDENCE')
 
     # Read audio data & handle errors
     try:
-        audio_data = readAudioData(file.file_name, conf.getfloat('OVERLAP'), model.sample_rate, model.chunk_duration)
+        audio_data = readAudioData(file.file_name, overlap, model.sample_rate, model.chunk_duration)
     except (NameError, TypeError) as e:
         log.error("Error with the following info: %s", e)
         return []
 
     # Process audio data and get detections
-    raw_detections, predicted_species_list = analyzeAudioData(audio_data, conf.getfloat('OVERLAP'), conf.getfloat('LATITUDE'),
+    raw_detections, predicted_species_list = analyzeAudioData(audio_data, overlap, conf.getfloat('LATITUDE'),
                                                               conf.getfloat('LONGITUDE'), file.week)
     confident_detections = []
     for time_slot, entries in raw_detections.items():
         sci_name, confidence = entries[0]
         log.info('%s-(%s_%s, %s)', time_slot, sci_name, names.get(sci_name, sci_name), confidence)
+        start, stop = time_slot.split(';')
         for sci_name, confidence in entries:
-            if confidence >= conf.getfloat('CONFIDENCE'):
+            if confidence >= min_confidence:
                 com_name = names.get(sci_name, sci_name)
                 if sci_name not in include_list and len(include_list) != 0:
                     log.warning("Excluded as INCLUDE_LIST is active but this species is not in it: %s %s", sci_name, com_name)
@@ -172,8 +184,8 @@ def run_analysis(file):
                 else:
                     d = Detection(
                         file.file_date,
-                        time_slot.split(';')[0],
-                        time_slot.split(';')[1],
+                        start,
+                        stop,
                         sci_name,
                         com_name,
                         confidence,
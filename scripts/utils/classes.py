@@ -1,9 +1,14 @@
 import datetime
 import os
 import re
+from functools import cached_property
 
 from tzlocal import get_localzone
 
+_DATE_RE = re.compile('^[0-9]+-[0-9]+-[0-9]+')
+_TIME_RE = re.compile('[0-9]+:[0-9]+:[0-9]+$')
+_RTSP_RE = re.compile('RTSP_[0-9]+-')
+
 
 class Detection:
     def __init__(self, file_date, start_time, stop_time, scientific_name, common_name, confidence):
@@ -30,20 +35,20 @@ class ParseFileName:
     def __init__(self, file_name):
         self.file_name = file_name
         name = os.path.splitext(os.path.basename(file_name))[0]
-        date_created = re.search('^[0-9]+-[0-9]+-[0-9]+', name).group()
-        time_created = re.search('[0-9]+:[0-9]+:[0-9]+$', name).group()
+        date_created = _DATE_RE.search(name).group()
+        time_created = _TIME_RE.search(name).group()
         self.file_date = datetime.datetime.strptime(f'{date_created}T{time_created}', "%Y-%m-%dT%H:%M:%S")
         self.root = name
 
-        ident_match = re.search("RTSP_[0-9]+-", file_name)
+        ident_match = _RTSP_RE.search(file_name)
         self.RTSP_id = ident_match.group() if ident_match is not None else ""
 
-    @property
+    @cached_property
     def iso8601(self):
         current_iso8601 = self.file_date.astimezone(get_localzone()).isoformat()
         return current_iso8601
 
-    @property
+    @cached_property
     def week(self):
         week = self.file_date.isocalendar()[1]
         return week
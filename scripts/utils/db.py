@@ -12,14 +12,17 @@ def get_db():
     if _DB is None:
         con = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
         con.row_factory = sqlite3.Row
+        # the connection lives as long as the process: memory-map the file and give it a larger page cache
+        con.execute("PRAGMA mmap_size=268435456")
+        con.execute("PRAGMA cache_size=-16384")
         _DB = con
     return _DB
 
 
-def get_records(select_sql):
+def get_records(select_sql, params=()):
     con = get_db()
     try:
-        cur = con.execute(select_sql)
+        cur = con.execute(select_sql, params)
         records = cur.fetchall()
     except sqlite3.Error as e:
         print(e)
@@ -28,8 +31,8 @@ def get_records(select_sql):
     return records
 
 
-def get_record(select_sql):
-    records = get_records(select_sql)
+def get_record(select_sql, params=()):
+    records = get_records(select_sql, params)
     return dict(records[0]) if records else None
 
 
@@ -38,18 +41,13 @@ def get_latest():
     return get_record(select_sql)
 
 
-def get_todays_count_for(sci_name):
-    today = datetime.now().strftime("%Y-%m-%d")
-    select_sql = f"SELECT COUNT(*) FROM detections WHERE Date = DATE('{today}') AND Sci_Name = '{sci_name}'"
-    records = get_records(select_sql)
-    return records[0][0] if records else 0
-
-
-def get_this_weeks_count_for(sci_name):
+def get_recent_counts_for(sci_name):
+    # today's and the last 7 days' detections of a species in one query, today is inside the 7 day range
     today = datetime.now().strftime("%Y-%m-%d")
-    select_sql = f"SELECT COUNT(*) FROM detections WHERE Date >= DATE('{today}', '-7 day') AND Sci_Name = '{sci_name}'"
-    records = get_records(select_sql)
-    return records[0][0] if records else 0
+    select_sql = ("SELECT COUNT(CASE WHEN Date = DATE(?) THEN 1 END), COUNT(*) "
+                  "FROM detections WHERE Date >= DATE(?, '-7 day') AND Sci_Name = ?")
+    records = get_records(select_sql, (today, today, sci_name))
+    return (records[0][0], records[0][1]) if records else (0, 0)
 
 
 def get_summary():
@@ -8,27 +8,31 @@ from configparser import ConfigParser
 from itertools import chain
 
 _settings = None
+_file_cache = {}
 
 BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 DB_PATH = os.path.join(BASE_PATH, 'scripts/birds.db')
 MODEL_PATH = os.path.join(BASE_PATH, 'model')
 FONT_DIR = os.path.join(BASE_PATH, 'homepage/static')
 ANALYZING_NOW = os.path.expanduser('~/BirdSongs/StreamData/analyzing_now.txt')
+_LABEL_SUFFIX_RE = re.compile(r'_.+$')
+
+DEFAULT_FONT = {'font.family': 'Roboto Flex', 'path': os.path.join(FONT_DIR, 'RobotoFlex-Regular.ttf')}
+_NOTO_JP = {'font.family': 'Noto Sans JP', 'path': os.path.join(FONT_DIR, 'NotoSansJP-Regular.ttf')}
+# languages that need a script Roboto Flex does not cover
+FONTS = {
+    'ar': {'font.family': 'Noto Sans Arabic', 'path': os.path.join(FONT_DIR, 'NotoSansArabic-Regular.ttf')},
+    'ja': _NOTO_JP,
+    'zh_CN': _NOTO_JP,
+    'zh_TW': _NOTO_JP,
+    'ko': {'font.family': 'Noto Sans KR', 'path': os.path.join(FONT_DIR, 'NotoSansKR-Regular.ttf')},
+    'th': {'font.family': 'Noto Sans Thai', 'path': os.path.join(FONT_DIR, 'NotoSansThai-Regular.ttf')},
+}
 
 
 def get_font():
     conf = get_settings()
-    if conf['DATABASE_LANG'] == 'ar':
-        ret = {'font.family': 'Noto Sans Arabic', 'path': os.path.join(FONT_DIR, 'NotoSansArabic-Regular.ttf')}
-    elif conf['DATABASE_LANG'] in ['ja', 'zh_CN', 'zh_TW']:
-        ret = {'font.family': 'Noto Sans JP', 'path': os.path.join(FONT_DIR, 'NotoSansJP-Regular.ttf')}
-    elif conf['DATABASE_LANG'] == 'ko':
-        ret = {'font.family': 'Noto Sans KR', 'path': os.path.join(FONT_DIR, 'NotoSansKR-Regular.ttf')}
-    elif conf['DATABASE_LANG'] == 'th':
-        ret = {'font.family': 'Noto Sans Thai', 'path': os.path.join(FONT_DIR, 'NotoSansThai-Regular.ttf')}
-    else:
-        ret = {'font.family': 'Roboto Flex', 'path': os.path.join(FONT_DIR, 'RobotoFlex-Regular.ttf')}
-    return ret
+    return FONTS.get(conf['DATABASE_LANG'], DEFAULT_FONT)
 
 
 class PHPConfigParser(ConfigParser):
@@ -61,7 +65,7 @@ def get_settings(settings_path='/etc/birdnet/birdnet.conf', force_reload=False):
 def get_open_files_in_dir(dir_name):
     result = subprocess.run(['lsof', '-w', '-Fn', '+D', f'{dir_name}'], check=False, capture_output=True)
     ret = result.stdout.decode('utf-8')
-    err = result.stderr.decode('utf-8')
+    err = result.stderr.decode('utf-8', errors='replace')
     if err:
         raise RuntimeError(f'{ret}:\n {err}')
     names = [line.lstrip('n') for line in ret.splitlines() if line.startswith('n')]
@@ -73,9 +77,8 @@ def get_wav_files():
     files = (glob.glob(os.path.join(conf['RECS_DIR'], '*/*/*.wav')) +
              glob.glob(os.path.join(conf['RECS_DIR'], 'StreamData/*.wav')))
     files.sort()
-    files = [os.path.join(conf['RECS_DIR'], file) for file in files]
     rec_dir = os.path.join(conf['RECS_DIR'], 'StreamData')
-    open_recs = get_open_files_in_dir(rec_dir)
+    open_recs = set(get_open_files_in_dir(rec_dir))
     files = [file for file in files if file not in open_recs]
     return files
 
@@ -84,9 +87,21 @@ def get_language(language=None):
     if language is None:
         language = get_settings()['DATABASE_LANG']
     file_name = os.path.join(MODEL_PATH, f'l18n/labels_{language}.json')
-    with open(file_name) as f:
-        ret = json.loads(f.read())
-    return ret
+    # callers get a copy since some of them edit the labels
+    return dict(read_cached(file_name, json.loads))
+
+
+def read_cached(path, parse):
+    # for files that are read over and over but rarely edited: parse(contents) is only run again when
+    # the file changed, going by its mtime and size
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get((path, parse))
+    if cached is None or cached[0] != key:
+        with open(path) as f:
+            cached = (key, parse(f.read()))
+        _file_cache[(path, parse)] = cached
+    return cached[1]
 
 
 def save_language(labels, language):
@@ -102,7 +117,7 @@ def get_model_labels(model=None):
     with open(file_name) as f:
         labels = [line.strip() for line in f.readlines()]
     if labels and labels[0].count('_') == 1:
-        labels = [re.sub(r'_.+$', '', label) for label in labels]
+        labels = [_LABEL_SUFFIX_RE.sub('', label) for label in labels]
     return labels
 
 
@@ -68,10 +68,18 @@ class Basemodel:
         self._output_layer_idx = output_details[self._output_layer]['index']
 
         self.labels = get_model_labels(self.model_name)
+        self._unique_labels = len(set(self.labels)) == len(self.labels)
 
     def label(self, logits):
-        p_labels = dict(zip(self.labels, logits))
-        return sorted(p_labels.items(), key=operator.itemgetter(1), reverse=True)
+        if not self._unique_labels:
+            # duplicate labels: let the dict collapse them like it always did
+            p_labels = dict(zip(self.labels, logits))
+            return sorted(p_labels.items(), key=operator.itemgetter(1), reverse=True)
+        # rank in numpy rather than building a dict and sorting thousands of tuples for every chunk;
+        # a stable sort keeps the same order for ties as sorted(..., reverse=True)
+        order = np.argsort(-logits, kind='stable')
+        labels = self.labels
+        return [(labels[i], p) for i, p in zip(order.tolist(), logits[order])]
 
     def predict(self, chunk):
         raise NotImplementedError
@@ -80,7 +88,7 @@ class Basemodel:
         pass
 
     def get_species_list(self):
-        return []
+        return frozenset()
 
 
 class BirdNet(Basemodel):
@@ -203,10 +211,12 @@ class MDataModel:
 
         self._mdata_params = None
         self._mdata = None
+        self._species_list = None
 
     def set_meta_data(self, lat, lon, week):
         if self._mdata_params != (lat, lon, week):
             self._mdata = None
+            self._species_list = None
         self._mdata_params = (lat, lon, week)
 
     def get_species_list_details(self, labels):
@@ -234,8 +244,12 @@ class MDataModel:
         return self._mdata
 
     def get_species_list(self, labels):
-        l_filter = self.get_species_list_details(labels)
-        return [s[1].split('_')[0] for s in l_filter]
+        # only changes with the meta data (i.e. once a week), not for every recording
+        if self._species_list is None:
+            l_filter = self.get_species_list_details(labels)
+            # only used for membership tests on every detection
+            self._species_list = frozenset(s[1].split('_')[0] for s in l_filter)
+        return self._species_list
 
 
 class MDataModel1(MDataModel):
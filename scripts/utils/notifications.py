@@ -3,17 +3,26 @@ import os
 import socket
 import requests
 import html
+import re
 import time
+from functools import lru_cache
 
-from .db import get_todays_count_for, get_this_weeks_count_for
-from .helpers import get_settings
+from .db import get_recent_counts_for
+from .helpers import get_settings, read_cached
 
 userDir = os.path.expanduser('~')
 APPRISE_CONFIG = userDir + '/BirdNET-Pi/apprise.txt'
 APPRISE_BODY = userDir + '/BirdNET-Pi/body.txt'
 
+# $confidencepct has to come before $confidence, the first matching alternative wins
+TEMPLATE_VARIABLES = re.compile(r'\$(sciname|comname|confidencepct|confidence|listenurl|friendlyurl|date|time|week|latitude|longitude|cutoff|sens|'
+                                r'flickrimage|image|overlap|reason)')
+
+IMAGE_RETRY_SECONDS = 600
+
 apobj = None
 images = {}
+image_failures = {}
 species_last_notified = {}
 
 
@@ -44,34 +53,40 @@ def notify(body, title, attached=""):
         )
 
 
+def get_body_template():
+    # the template only changes when it is edited in the web UI
+    return read_cached(APPRISE_BODY, str)
+
+
 def sendAppriseNotifications(sci_name, com_name, confidence, confidencepct, path, date, time_of_day, week, latitude, longitude, cutoff, sens, overlap):
     def render_template(template, reason=""):
-        ret = template.replace("$sciname", sci_name) \
-            .replace("$comname", com_name) \
-            .replace("$confidencepct", str(confidencepct)) \
-            .replace("$confidence", str(confidence)) \
-            .replace("$listenurl", listenurl) \
-            .replace("$friendlyurl", friendlyurl) \
-            .replace("$date", str(date)) \
-            .replace("$time", str(time_of_day)) \
-            .replace("$week", str(week)) \
-            .replace("$latitude", str(latitude)) \
-            .replace("$longitude", str(longitude)) \
-            .replace("$cutoff", str(cutoff)) \
-            .replace("$sens", str(sens)) \
-            .replace("$flickrimage", image_url if "{" in body else "") \
-            .replace("$image", image_url if "{" in body else "") \
-            .replace("$overlap", str(overlap)) \
-            .replace("$reason", reason)
-        return ret
+        values = {
+            "sciname": sci_name,
+            "comname": com_name,
+            "confidencepct": str(confidencepct),
+            "confidence": str(confidence),
+            "listenurl": listenurl,
+            "friendlyurl": friendlyurl,
+            "date": str(date),
+            "time": str(time_of_day),
+            "week": str(week),
+            "latitude": str(latitude),
+            "longitude": str(longitude),
+            "cutoff": str(cutoff),
+            "sens": str(sens),
+            "flickrimage": image_url if "{" in body else "",
+            "image": image_url if "{" in body else "",
+            "overlap": str(overlap),
+            "reason": reason,
+        }
+        return TEMPLATE_VARIABLES.sub(lambda match: values[match.group(1)], template)
 
     if not should_notify(com_name):
         return
 
     settings_dict = get_settings()
     title = html.unescape(settings_dict.get('APPRISE_NOTIFICATION_TITLE'))
-    f = open(APPRISE_BODY, 'r')
-    body = f.read()
+    body = get_body_template()
 
     websiteurl = settings_dict.get('BIRDNETPI_URL')
     if websiteurl is None or len(websiteurl) == 0:
@@ -82,13 +97,15 @@ def sendAppriseNotifications(sci_name, com_name, confidence, confidencepct, path
 
     image_url = ""
     if "$flickrimage" in body or "$image" in body:
-        if com_name not in images:
+        # don't stall every notification on the (up to 10s) lookup while the image API is failing
+        if com_name not in images and time.time() - image_failures.get(com_name, 0) > IMAGE_RETRY_SECONDS:
             try:
                 url = f"http://localhost/api/v1/image/{sci_name}"
                 resp = requests.get(url=url, timeout=10).json()
                 images[com_name] = resp['data']['image_url']
             except Exception as e:
                 print("IMAGE API ERROR:", e)
+                image_failures[com_name] = time.time()
         image_url = images.get(com_name, "")
 
     if settings_dict.get('APPRISE_NOTIFY_EACH_DETECTION') == "1":
@@ -98,9 +115,14 @@ def sendAppriseNotifications(sci_name, com_name, confidence, confidencepct, path
         notify(notify_body, notify_title, image_url)
         species_last_notified[com_name] = int(time.time())
 
+    notify_new_today = settings_dict.get('APPRISE_NOTIFY_NEW_SPECIES_EACH_DAY') == "1"
+    notify_new_week = settings_dict.get('APPRISE_NOTIFY_NEW_SPECIES') == "1"
+    if notify_new_today or notify_new_week:
+        todays_count, weeks_count = get_recent_counts_for(sci_name)
+
     APPRISE_NOTIFICATION_NEW_SPECIES_DAILY_COUNT_LIMIT = 1  # Notifies the first N per day.
-    if settings_dict.get('APPRISE_NOTIFY_NEW_SPECIES_EACH_DAY') == "1":
-        numberDetections = get_todays_count_for(sci_name)
+    if notify_new_today:
+        numberDetections = todays_count
         if 0 < numberDetections <= APPRISE_NOTIFICATION_NEW_SPECIES_DAILY_COUNT_LIMIT:
             reason = "first time today"
             notify_body = render_template(body, reason)
@@ -108,8 +130,8 @@ def sendAppriseNotifications(sci_name, com_name, confidence, confidencepct, path
             notify(notify_body, notify_title, image_url)
             species_last_notified[com_name] = int(time.time())
 
-    if settings_dict.get('APPRISE_NOTIFY_NEW_SPECIES') == "1":
-        numberDetections = get_this_weeks_count_for(sci_name)
+    if notify_new_week:
+        numberDetections = weeks_count
         if 0 < numberDetections <= 5:
             reason = f"only seen {numberDetections} times in last 7d"
             notify_body = render_template(body, reason)
@@ -118,22 +140,32 @@ def sendAppriseNotifications(sci_name, com_name, confidence, confidencepct, path
             species_last_notified[com_name] = int(time.time())
 
 
+@lru_cache(maxsize=8)
+def parse_species_names(names):
+    # keyed on the raw setting, so it is only parsed again when the setting changes
+    return frozenset(bird.lower().replace(" ", "") for bird in names.split(","))
+
+
 def should_notify(com_name):
     settings_dict = get_settings()
-    if not (os.path.exists(APPRISE_CONFIG) and os.path.getsize(APPRISE_CONFIG) > 0):
+    # one stat covers both "exists" and "not empty"
+    try:
+        if os.stat(APPRISE_CONFIG).st_size == 0:
+            return False
+    except OSError:
         return False
 
     # check if this is an excluded species
     APPRISE_ONLY_NOTIFY_SPECIES_NAMES = settings_dict.get('APPRISE_ONLY_NOTIFY_SPECIES_NAMES')
     if APPRISE_ONLY_NOTIFY_SPECIES_NAMES is not None and APPRISE_ONLY_NOTIFY_SPECIES_NAMES.strip() != "":
-        excluded_species = [bird.lower().replace(" ", "") for bird in APPRISE_ONLY_NOTIFY_SPECIES_NAMES.split(",")]
+        excluded_species = parse_species_names(APPRISE_ONLY_NOTIFY_SPECIES_NAMES)
         if com_name.lower().replace(" ", "") in excluded_species:
             return False
 
     # check if this is an included species
     APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2 = settings_dict.get('APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2')
     if APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2 is not None and APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2.strip() != "":
-        included_species = [bird.lower().replace(" ", "") for bird in APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2.split(",")]
+        included_species = parse_species_names(APPRISE_ONLY_NOTIFY_SPECIES_NAMES_2)
         if com_name.lower().replace(" ", "") not in included_species:
             return False
 
@@ -18,12 +18,26 @@ from .notifications import sendAppriseNotifications
 
 log = logging.getLogger(__name__)
 
+HOME_DIR = os.path.expanduser('~/')
+BIRDDB_TXT = os.path.expanduser('~/BirdNET-Pi/BirdDB.txt')
+
+_session = None
+_DB = None
+
+
+def get_session():
+    # keep-alive: BirdWeather gets one POST per detection, don't set up a new TLS connection for each of them
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 
 def extract(in_file, out_file, start, stop):
     result = subprocess.run(['sox', '-V1', f'{in_file}', f'{out_file}', 'trim', f'={start}', f'={stop}'],
                             check=True, capture_output=True)
     ret = result.stdout.decode('utf-8')
-    err = result.stderr.decode('utf-8')
+    err = result.stderr.decode('utf-8', errors='replace')
     if err:
         raise RuntimeError(f'{ret}:\n {err}')
     return ret
@@ -55,18 +69,19 @@ def spectrogram(in_file, title, comment, raw=0):
 
     result = subprocess.run(args, check=True, capture_output=True)
     ret = result.stdout.decode('utf-8')
-    err = result.stderr.decode('utf-8')
+    err = result.stderr.decode('utf-8', errors='replace')
     if err:
         raise RuntimeError(f'{ret}:\n {err}')
     img = Image.open(tmp_file)
     height = img.size[1]
     width = img.size[0]
     draw = ImageDraw.Draw(img)
-    title_font = ImageFont.truetype(get_font()['path'], 13)
+    font_path = get_font()['path']
+    title_font = ImageFont.truetype(font_path, 13)
     _, _, w, _ = draw.textbbox((0, 0), title, font=title_font)
     draw.text(((width-w)/2, 6), title, fill="white", font=title_font)
 
-    comment_font = ImageFont.truetype(get_font()['path'], 11)
+    comment_font = ImageFont.truetype(font_path, 11)
     _, _, _, h = draw.textbbox((0, 0), comment, font=comment_font)
     draw.text((1, height - (h + 1)), comment, fill="white", font=comment_font)
     img.save(f'{in_file}.png')
@@ -83,30 +98,48 @@ def extract_detection(file: ParseFileName, detection: Detection):
     else:
         os.makedirs(new_dir, exist_ok=True)
         extract_safe(file.file_name, new_file, detection.start, detection.stop)
-        spectrogram(new_file, detection.common_name, new_file.replace(os.path.expanduser('~/'), ''), conf['RAW_SPECTROGRAM'])
+        spectrogram(new_file, detection.common_name, new_file.replace(HOME_DIR, ''), conf['RAW_SPECTROGRAM'])
     return new_file
 
 
+def get_write_db():
+    # the reporting thread is the only writer, keep its connection open instead of reconnecting per detection
+    global _DB
+    if _DB is None:
+        _DB = sqlite3.connect(DB_PATH)
+    return _DB
+
+
+def close_write_db():
+    global _DB
+    if _DB is not None:
+        try:
+            _DB.close()
+        except sqlite3.Error:
+            pass
+        _DB = None
+
+
 def write_to_db(file: ParseFileName, detection: Detection):
     conf = get_settings()
     # Connect to SQLite Database
     for attempt_number in range(3):
         try:
-            con = sqlite3.connect(DB_PATH)
-            cur = con.cursor()
-            cur.execute("INSERT INTO detections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                        (detection.date, detection.time, detection.scientific_name, detection.common_name, detection.confidence,
-                         conf['LATITUDE'], conf['LONGITUDE'], conf['CONFIDENCE'], str(detection.week), conf['SENSITIVITY'],
-                         conf['OVERLAP'], os.path.basename(detection.file_name_extr)))
-            # (Date, Time, Sci_Name, Com_Name, str(score),
-            # Lat, Lon, Cutoff, Week, Sens,
-            # Overlap, File_Name))
-
-            con.commit()
-            con.close()
+            con = get_write_db()
+            # commits on success, rolls back on failure so a retry does not insert twice
+            with con:
+                con.execute("INSERT INTO detections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (detection.date, detection.time, detection.scientific_name, detection.common_name, detection.confidence,
+                             conf['LATITUDE'], conf['LONGITUDE'], conf['CONFIDENCE'], str(detection.week), conf['SENSITIVITY'],
+                             conf['OVERLAP'], os.path.basename(detection.file_name_extr)))
+                # (Date, Time, Sci_Name, Com_Name, str(score),
+                # Lat, Lon, Cutoff, Week, Sens,
+                # Overlap, File_Name))
             break
         except BaseException as e:
             log.warning("Database busy: %s", e)
+            # the handle itself may be broken (I/O error, replaced file), reconnect on the next attempt
+            close_write_db()
             sleep(2)
 
 
@@ -122,7 +155,7 @@ def summary(file: ParseFileName, detection: Detection):
 
 
 def write_to_file(file: ParseFileName, detection: Detection):
-    with open(os.path.expanduser('~/BirdNET-Pi/BirdDB.txt'), 'a') as rfile:
+    with open(BIRDDB_TXT, 'a') as rfile:
         rfile.write(f'{summary(file, detection)}\n')
 
 
@@ -133,7 +166,11 @@ def update_json_file(file: ParseFileName, detections: [Detection]):
         mask = f'{os.path.dirname(file.file_name)}/*{file.RTSP_id}*.json'
     for f in glob.glob(mask):
         log.debug(f'deleting {f}')
-        os.remove(f)
+        try:
+            os.remove(f)
+        except FileNotFoundError:
+            # already gone, do not abort reporting for this recording over it
+            pass
     write_to_json_file(file, detections)
 
 
@@ -144,13 +181,16 @@ def write_to_json_file(file: ParseFileName, detections: [Detection]):
     dets = {'file_name': os.path.basename(json_file), 'timestamp': file.iso8601, 'delay': conf['RECORDING_LENGTH'],
             'detections': [{"start": det.start, "common_name": det.common_name, "confidence": det.confidence} for det in
                            detections]}
-    with open(json_file, 'w') as rfile:
+    # the web interface polls this file, write it next to it and swap it in atomically
+    tmp_file = f'{json_file}.tmp'
+    with open(tmp_file, 'w') as rfile:
         rfile.write(json.dumps(dets))
+    os.replace(tmp_file, json_file)
     log.debug(f'DONE! WROTE {len(detections)} RESULTS.')
 
 
 def apprise(file: ParseFileName, detections: [Detection]):
-    species_apprised_this_run = []
+    species_apprised_this_run = set()
     conf = get_settings()
 
     for detection in detections:
@@ -164,7 +204,7 @@ def apprise(file: ParseFileName, detections: [Detection]):
             except BaseException as e:
                 log.exception('Error during Apprise:', exc_info=e)
 
-            species_apprised_this_run.append(detection.species)
+            species_apprised_this_run.add(detection.species)
 
 
 def bird_weather(file: ParseFileName, detections: [Detection]):
@@ -186,8 +226,8 @@ def bird_weather(file: ParseFileName, detections: [Detection]):
                           f'{conf["BIRDWEATHER_ID"]}/soundscapes?timestamp={file.iso8601}')
 
         try:
-            response = requests.post(url=soundscape_url, data=flac_data, timeout=30,
-                                     headers={'Content-Type': 'audio/flac'})
+            response = get_session().post(url=soundscape_url, data=flac_data, timeout=30,
+                                          headers={'Content-Type': 'audio/flac'})
             log.info("Soundscape POST Response Status - %d", response.status_code)
             sdata = response.json()
         except BaseException as e:
@@ -211,7 +251,7 @@ def bird_weather(file: ParseFileName, detections: [Detection]):
 
             log.debug(data)
             try:
-                response = requests.post(detection_url, json=data, timeout=20)
+                response = get_session().post(detection_url, json=data, timeout=20)
                 log.info("Detection POST Response Status - %d", response.status_code)
             except BaseException as e:
                 log.error("Cannot POST detection: %s", e)
@@ -221,7 +261,7 @@ def heartbeat():
     conf = get_settings()
     if conf['HEARTBEAT_URL']:
         try:
-            result = requests.get(url=conf['HEARTBEAT_URL'], timeout=10)
+            result = get_session().get(url=conf['HEARTBEAT_URL'], timeout=10)
             log.info('Heartbeat: %s', result.text)
         except BaseException as e:
             log.error('Error during heartbeat: %s', e)
@@ -1,11 +1,12 @@
 import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from scripts.utils.analysis import run_analysis
 from scripts.utils.classes import ParseFileName
 from tests.helpers import TESTDATA, Settings
-from scripts.utils.analysis import filter_humans
+from scripts.utils.analysis import filter_humans, loadCustomSpeciesList
 
 
 class TestRunAnalysis(unittest.TestCase):
@@ -195,5 +196,41 @@ class TestFilterHumans(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestLoadCustomSpeciesList(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.list_file = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+
+    def tearDown(self):
+        if os.path.exists(self.list_file):
+            os.remove(self.list_file)
+
+    def write_list(self, content):
+        with open(self.list_file, 'w') as f:
+            f.write(content)
+
+    def test_missing_file(self):
+        os.remove(self.list_file)
+        self.assertEqual(loadCustomSpeciesList(self.list_file), frozenset())
+
+    def test_blank_lines_only(self):
+        # a list with nothing but a newline is inactive, it must not filter out every detection
+        self.write_list('\n')
+        self.assertEqual(loadCustomSpeciesList(self.list_file), frozenset())
+
+    def test_labels(self):
+        self.write_list('Pica pica_Eurasian Magpie\n\nTurdus merula\n')
+        self.assertEqual(loadCustomSpeciesList(self.list_file), frozenset({'Pica pica', 'Turdus merula'}))
+
+    def test_rewritten_file(self):
+        self.write_list('Pica pica_Eurasian Magpie\n')
+        self.assertEqual(loadCustomSpeciesList(self.list_file), frozenset({'Pica pica'}))
+
+        # edited from the web UI while the analysis keeps running
+        self.write_list('Turdus merula_Eurasian Blackbird\nErithacus rubecula_European Robin\n')
+        self.assertEqual(loadCustomSpeciesList(self.list_file), frozenset({'Turdus merula', 'Erithacus rubecula'}))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from scripts.utils import helpers
+from scripts.utils.helpers import get_language, read_cached
+
+
+class TestGetLanguage(unittest.TestCase):
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self.model_dir.name, 'l18n'))
+        self.labels_file = os.path.join(self.model_dir.name, 'l18n', 'labels_en.json')
+        patcher = patch.object(helpers, 'MODEL_PATH', self.model_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.model_dir.cleanup)
+
+    def write_labels(self, labels):
+        with open(self.labels_file, 'w') as f:
+            json.dump(labels, f)
+
+    def test_get_language(self):
+        self.write_labels({'Pica pica': 'Eurasian Magpie'})
+        self.assertEqual(get_language('en'), {'Pica pica': 'Eurasian Magpie'})
+
+    def test_rewritten_file(self):
+        self.write_labels({'Pica pica': 'Eurasian Magpie'})
+        self.assertEqual(get_language('en'), {'Pica pica': 'Eurasian Magpie'})
+
+        # e.g. install_language_label.sh installing a new translation
+        self.write_labels({'Pica pica': 'Magpie', 'Turdus merula': 'Blackbird'})
+        self.assertEqual(get_language('en'), {'Pica pica': 'Magpie', 'Turdus merula': 'Blackbird'})
+
+    def test_returns_copy(self):
+        self.write_labels({'Pica pica': 'Eurasian Magpie'})
+        labels = get_language('en')
+        labels['Pica pica'] = 'changed'
+        self.assertEqual(get_language('en'), {'Pica pica': 'Eurasian Magpie'})
+
+
+class TestReadCached(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.file_name = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.file_name)
+        self.parsed = []
+
+    def parse(self, text):
+        self.parsed.append(text)
+        return text.upper()
+
+    def write(self, content):
+        with open(self.file_name, 'w') as f:
+            f.write(content)
+
+    def test_parsed_once(self):
+        self.write('magpie')
+        self.assertEqual(read_cached(self.file_name, self.parse), 'MAGPIE')
+        self.assertEqual(read_cached(self.file_name, self.parse), 'MAGPIE')
+        self.assertEqual(self.parsed, ['magpie'])
+
+    def test_rewritten_file(self):
+        self.write('magpie')
+        self.assertEqual(read_cached(self.file_name, self.parse), 'MAGPIE')
+        self.write('blackbird')
+        self.assertEqual(read_cached(self.file_name, self.parse), 'BLACKBIRD')
+        self.assertEqual(self.parsed, ['magpie', 'blackbird'])
+
+
+if __name__ == '__main__':
+    unittest.main()